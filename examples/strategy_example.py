@@ -7,8 +7,67 @@ This example demonstrates how to implement a Python strategy that:
 3. Follows the vnpy_ctastrategy template pattern
 """
 
-from typing import Dict, List
+import itertools
+import math
+from typing import Dict, List, Optional
 from datetime import datetime
+from logging import INFO, WARNING
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, fall back to running kernels as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _ma_signals(closes, fast_window, slow_window):
+    """
+    Compute double MA crossover signals over the full close series
+    
+    Returns:
+        (signals, fast_ma, slow_ma) where signals is +1 on bars where the
+        trend turns bullish, -1 where it turns bearish and 0 elsewhere,
+        and fast_ma / slow_ma are the values on the last bar
+    """
+    n = closes.shape[0]
+    signals = np.zeros(n, dtype=np.int8)
+    
+    fast_sum = 0.0
+    slow_sum = 0.0
+    fast_ma = 0.0
+    slow_ma = 0.0
+    trend = 0
+    
+    for i in range(n):
+        close = closes[i]
+        fast_sum += close
+        slow_sum += close
+        if i >= fast_window:
+            fast_sum -= closes[i - fast_window]
+        if i >= slow_window:
+            slow_sum -= closes[i - slow_window]
+        
+        # Need enough data
+        if i + 1 < slow_window:
+            continue
+        
+        fast_ma = fast_sum / fast_window
+        slow_ma = slow_sum / slow_window
+        
+        if fast_ma > slow_ma:
+            if trend != 1:
+                trend = 1
+                signals[i] = 1
+        elif fast_ma < slow_ma:
+            if trend != -1:
+                trend = -1
+                signals[i] = -1
+    
+    return signals, fast_ma, slow_ma
 
 
 class CtaTemplate:
@@ -18,6 +77,21 @@ class CtaTemplate:
     Similar to vnpy_ctastrategy.template.CtaTemplate but works with Rust engine
     """
     
+    __slots__ = (
+        "strategy_name",
+        "vt_symbols",
+        "strategy_type",
+        "inited",
+        "trading",
+        "parameters",
+        "variables",
+        "_symbol_idx",
+        "_positions_arr",
+        "_log_level",
+        "_log_buffer",
+        "_order_counter",
+    )
+    
     def __init__(
         self,
         strategy_name: str,
@@ -33,16 +107,23 @@ class CtaTemplate:
         self.inited = False
         self.trading = False
         
-        # Positions tracking
-        self.positions: Dict[str, float] = {}
-        for symbol in vt_symbols:
-            self.positions[symbol] = 0.0
+        # Positions tracking, one array slot per symbol
+        self._symbol_idx: Dict[str, int] = {s: i for i, s in enumerate(vt_symbols)}
+        self._positions_arr = np.zeros(len(vt_symbols), dtype=np.float64)
         
         # Parameters (to be set by subclass)
         self.parameters: Dict[str, any] = {}
         
         # Variables (to be updated by subclass)
         self.variables: Dict[str, any] = {}
+        
+        # Logging: messages below the level are dropped before formatting,
+        # and batched messages are held until flush_log()
+        self._log_level = INFO
+        self._log_buffer: Optional[List[str]] = None
+        
+        # Sequence for local orderids
+        self._order_counter = itertools.count(1)
     
     def on_init(self):
         """
@@ -71,6 +152,7 @@ class CtaTemplate:
             tick: {
                 'symbol': str,
                 'exchange': str,
+                'vt_symbol': str,  # '{symbol}.{exchange}', built once by the feed
                 'datetime': datetime,
                 'last_price': float,
                 'volume': float,
@@ -89,6 +171,7 @@ class CtaTemplate:
             bar: {
                 'symbol': str,
                 'exchange': str,
+                'vt_symbol': str,  # '{symbol}.{exchange}', built once by the feed
                 'datetime': datetime,
                 'interval': str,
                 'open': float,
@@ -110,6 +193,32 @@ class CtaTemplate:
         """
         pass
     
+    def vectorized_on_bars(self, closes: np.ndarray) -> np.ndarray:
+        """
+        Compute trading signals for a whole close series at once
+        
+        Strategies whose signals depend only on close prices can implement
+        this so backtests skip per-bar on_bar calls and only replay the
+        non-zero signals through on_signal.
+        
+        Args:
+            closes: Close prices of all bars, oldest first
+        
+        Returns:
+            Signal per bar: +1 buy, -1 sell, 0 nothing
+        """
+        raise NotImplementedError
+    
+    def on_signal(self, bar: dict, signal: int):
+        """
+        Called with a bar whose vectorized signal is non-zero
+        
+        Args:
+            bar: Bar data, same layout as on_bar
+            signal: +1 buy, -1 sell
+        """
+        pass
+    
     def on_order(self, order: dict):
         """
         Called when order status updates
@@ -137,6 +246,8 @@ class CtaTemplate:
                 'tradeid': str,
                 'orderid': str,
                 'symbol': str,
+                'exchange': str,
+                'vt_symbol': str,  # '{symbol}.{exchange}', built once by the feed
                 'direction': str,
                 'offset': str,
                 'price': float,
@@ -145,17 +256,17 @@ class CtaTemplate:
             }
         """
         # Update position
-        vt_symbol = f"{trade['symbol']}.{trade['exchange']}"
+        idx = self._symbol_idx[trade['vt_symbol']]
         if trade['direction'] == 'long':
             if trade['offset'] == 'open':
-                self.positions[vt_symbol] += trade['volume']
+                self._positions_arr[idx] += trade['volume']
             else:
-                self.positions[vt_symbol] -= trade['volume']
+                self._positions_arr[idx] -= trade['volume']
         else:  # short
             if trade['offset'] == 'open':
-                self.positions[vt_symbol] -= trade['volume']
+                self._positions_arr[idx] -= trade['volume']
             else:
-                self.positions[vt_symbol] += trade['volume']
+                self._positions_arr[idx] += trade['volume']
     
     def buy(self, vt_symbol: str, price: float, volume: float, lock: bool = False) -> str:
         """
@@ -190,7 +301,7 @@ class CtaTemplate:
             orderid
         """
         if self.strategy_type == "spot":
-            self.write_log("Short not supported for spot trading")
+            self.write_log("Short not supported for spot trading", level=WARNING)
             return ""
         
         if not self.trading:
@@ -206,7 +317,7 @@ class CtaTemplate:
             orderid
         """
         if self.strategy_type == "spot":
-            self.write_log("Cover not supported for spot trading")
+            self.write_log("Cover not supported for spot trading", level=WARNING)
             return ""
         
         if not self.trading:
@@ -219,7 +330,7 @@ class CtaTemplate:
         if not self.trading:
             return
         
-        self.write_log(f"Cancel order: {vt_orderid}")
+        self.write_log("Cancel order: %s", vt_orderid)
         # Call Rust engine to cancel
     
     def cancel_all(self):
@@ -241,19 +352,66 @@ class CtaTemplate:
     ) -> str:
         """Internal method to send order"""
         self.write_log(
-            f"Send order: {vt_symbol} {direction} {offset} @ {price} x{volume}"
+            "Send order: %s %s %s @ %s x%s", vt_symbol, direction, offset, price, volume
         )
         # Call Rust engine to send order
         # Return orderid from Rust
-        return f"order_{datetime.now().timestamp()}"
+        return f"order_{next(self._order_counter)}"
     
     def get_pos(self, vt_symbol: str) -> float:
         """Get current position for symbol"""
-        return self.positions.get(vt_symbol, 0.0)
+        idx = self._symbol_idx.get(vt_symbol)
+        if idx is None:
+            return 0.0
+        return float(self._positions_arr[idx])
+    
+    @property
+    def positions(self) -> Dict[str, float]:
+        """Current positions of all symbols"""
+        return dict(zip(self.vt_symbols, self._positions_arr.tolist()))
+    
+    def write_log(self, msg: str, *args, level: int = INFO):
+        """
+        Write log message
+        
+        Args:
+            msg: Message, %-formatted with args only if it will be written
+            level: Logging level (logging.INFO, logging.WARNING, ...)
+        """
+        if level < self._log_level:
+            return
+        
+        if args:
+            msg = msg % args
+        
+        line = f"[{self.strategy_name}] {msg}"
+        if self._log_buffer is not None:
+            self._log_buffer.append(line)
+        else:
+            print(line)
+    
+    def set_log_level(self, level: int):
+        """Set minimum level of messages written by write_log"""
+        self._log_level = level
+    
+    def get_log_level(self) -> int:
+        """Get minimum level of messages written by write_log"""
+        return self._log_level
     
-    def write_log(self, msg: str):
-        """Write log message"""
-        print(f"[{self.strategy_name}] {msg}")
+    def is_log_batching(self) -> bool:
+        """Whether log messages are currently held until flush_log"""
+        return self._log_buffer is not None
+    
+    def start_log_batch(self):
+        """Hold log messages in memory until flush_log is called"""
+        if self._log_buffer is None:
+            self._log_buffer = []
+    
+    def flush_log(self):
+        """Print batched log messages at once and stop batching"""
+        if self._log_buffer:
+            print("\n".join(self._log_buffer))
+        self._log_buffer = None
     
     def load_bars(self, days: int, interval: str = "1m"):
         """
@@ -263,7 +421,7 @@ class CtaTemplate:
             days: Number of days to load
             interval: Bar interval (1m, 5m, 15m, 1h, 1d)
         """
-        self.write_log(f"Loading {days} days of {interval} bars")
+        self.write_log("Loading %s days of %s bars", days, interval)
         # Call Rust engine to load historical data
     
     def put_event(self):
@@ -280,6 +438,20 @@ class DoubleMaStrategy(CtaTemplate):
     - When fast MA crosses below slow MA -> Sell
     """
     
+    __slots__ = (
+        "fast_window",
+        "slow_window",
+        "fixed_size",
+        "fast_ma",
+        "slow_ma",
+        "ma_trend",
+        "_closes",
+        "_head",
+        "_count",
+        "_fast_sum",
+        "_slow_sum",
+    )
+    
     def __init__(
         self,
         strategy_name: str,
@@ -313,8 +485,14 @@ class DoubleMaStrategy(CtaTemplate):
             "ma_trend": 0,
         }
         
-        # Historical data
-        self.bars: List[dict] = []
+        # Ring buffer of recent close prices, sized for the slow window
+        self._closes = np.empty(slow_window, dtype=np.float64)
+        self._head = 0      # Next write position in the ring
+        self._count = 0     # Number of bars received so far
+        
+        # Running sums of the closes inside each window
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
     
     def on_init(self):
         """Initialize strategy"""
@@ -337,58 +515,91 @@ class DoubleMaStrategy(CtaTemplate):
     
     def on_bar(self, bar: dict):
         """Process new bar"""
-        # Add to history
-        self.bars.append(bar)
-        
-        # Keep only necessary data
-        if len(self.bars) > self.slow_window * 2:
-            self.bars.pop(0)
+        close = bar['close']
+        closes = self._closes
+        head = self._head
+        
+        # Subtract the closes rolling out of each window before overwriting;
+        # ring reads are NumPy scalars, so keep the sums plain floats
+        if self._count >= self.slow_window:
+            self._slow_sum -= float(closes[head])
+        if self._count >= self.fast_window:
+            self._fast_sum -= float(closes[(head - self.fast_window) % self.slow_window])
+        
+        # Push the new close into the ring
+        closes[head] = close
+        self._fast_sum += close
+        self._slow_sum += close
+        self._head = (head + 1) % self.slow_window
+        self._count += 1
+        
+        # Re-anchor running sums once per ring cycle so float error cannot build up
+        if self._head == 0:
+            self._slow_sum = math.fsum(closes)
+            self._fast_sum = math.fsum(closes[-self.fast_window:])
         
         # Need enough data
-        if len(self.bars) < self.slow_window:
+        if self._count < self.slow_window:
             return
         
         # Calculate MAs
         self.calculate_ma()
         
-        # Trading logic
-        vt_symbol = f"{bar['symbol']}.{bar['exchange']}"
-        pos = self.get_pos(vt_symbol)
-        
         # Check for crossover
         if self.fast_ma > self.slow_ma:
             # Golden cross - bullish
             if self.ma_trend != 1:
-                self.ma_trend = 1
-                
-                # If no position or short, go long
-                if pos <= 0:
-                    self.buy(vt_symbol, bar['close'], self.fixed_size)
+                self.on_signal(bar, 1)
                     
         elif self.fast_ma < self.slow_ma:
             # Death cross - bearish
             if self.ma_trend != -1:
-                self.ma_trend = -1
-                
-                # If long position, close
-                if pos > 0:
-                    self.sell(vt_symbol, bar['close'], abs(pos))
+                self.on_signal(bar, -1)
         
         # Update UI
         self.put_event()
     
+    def on_signal(self, bar: dict, signal: int):
+        """Trade on MA trend change"""
+        self.ma_trend = signal
+        self.variables['ma_trend'] = signal
+        
+        vt_symbol = bar['vt_symbol']
+        pos = self.get_pos(vt_symbol)
+        
+        if signal > 0:
+            # If no position or short, go long
+            if pos <= 0:
+                self.buy(vt_symbol, bar['close'], self.fixed_size)
+        else:
+            # If long position, close
+            if pos > 0:
+                self.sell(vt_symbol, bar['close'], abs(pos))
+    
+    def vectorized_on_bars(self, closes: np.ndarray) -> np.ndarray:
+        """Compute MA crossover signals for the whole series in one pass"""
+        signals, fast_ma, slow_ma = _ma_signals(
+            np.ascontiguousarray(closes, dtype=np.float64),
+            self.fast_window,
+            self.slow_window
+        )
+        
+        # Leave MAs at their values on the last bar
+        self.fast_ma = fast_ma
+        self.slow_ma = slow_ma
+        self.variables['fast_ma'] = fast_ma
+        self.variables['slow_ma'] = slow_ma
+        
+        return signals
+    
     def calculate_ma(self):
         """Calculate moving averages"""
-        if len(self.bars) < self.slow_window:
+        if self._count < self.slow_window:
             return
         
-        # Calculate fast MA
-        fast_data = self.bars[-self.fast_window:]
-        self.fast_ma = sum(b['close'] for b in fast_data) / self.fast_window
-        
-        # Calculate slow MA
-        slow_data = self.bars[-self.slow_window:]
-        self.slow_ma = sum(b['close'] for b in slow_data) / self.slow_window
+        # Running sums are kept up to date in on_bar
+        self.fast_ma = self._fast_sum / self.fast_window
+        self.slow_ma = self._slow_sum / self.slow_window
         
         # Update variables
         self.variables['fast_ma'] = self.fast_ma
@@ -406,13 +617,28 @@ class GridStrategy(CtaTemplate):
     - Profit from oscillating market
     """
     
+    __slots__ = (
+        "grid_size",
+        "grid_num",
+        "order_size",
+        "pricetick",
+        "buy_orders",
+        "sell_orders",
+        "_order_ticks",
+        "last_price",
+        "_anchor_price",
+        "_buy_levels",
+        "_sell_levels",
+    )
+    
     def __init__(
         self,
         strategy_name: str,
         vt_symbols: List[str],
         grid_size: float = 10.0,
         grid_num: int = 5,
-        order_size: float = 0.1
+        order_size: float = 0.1,
+        pricetick: float = 0.01
     ):
         """Initialize with parameters"""
         super().__init__(strategy_name, vt_symbols, strategy_type="spot")
@@ -421,16 +647,25 @@ class GridStrategy(CtaTemplate):
         self.grid_size = grid_size  # Price distance between grids
         self.grid_num = grid_num    # Number of grids
         self.order_size = order_size
+        self.pricetick = pricetick  # Minimum price increment
         
         self.parameters = {
             "grid_size": grid_size,
             "grid_num": grid_num,
             "order_size": order_size,
+            "pricetick": pricetick,
         }
         
-        # Grid orders tracking
-        self.buy_orders: Dict[str, str] = {}   # price -> orderid
-        self.sell_orders: Dict[str, str] = {}  # price -> orderid
+        # Grid orders tracking, keyed by price in ticks (price / pricetick)
+        self.buy_orders: Dict[int, str] = {}   # tick -> orderid
+        self.sell_orders: Dict[int, str] = {}  # tick -> orderid
+        # Reverse lookup so fills away from the grid price still free their level
+        self._order_ticks: Dict[str, int] = {}  # orderid -> tick
+        
+        # Grid levels around the anchor price (tick -> price)
+        self._anchor_price: Optional[float] = None
+        self._buy_levels: Dict[int, float] = {}
+        self._sell_levels: Dict[int, float] = {}
         
         self.last_price = 0.0
     
@@ -464,6 +699,13 @@ class GridStrategy(CtaTemplate):
         """Process trade"""
         super().on_trade(trade)
         
+        # Filled grid order no longer needs tracking
+        tick = self._order_ticks.pop(trade['orderid'], None)
+        if tick is not None:
+            orders = self.buy_orders if trade['direction'] == 'long' else self.sell_orders
+            if orders.get(tick) == trade['orderid']:
+                del orders[tick]
+        
         # When a grid order is filled, place reverse order
         # This is the core grid trading logic
         
@@ -471,7 +713,7 @@ class GridStrategy(CtaTemplate):
             # Buy order filled, place sell order above
             sell_price = trade['price'] + self.grid_size
             self.sell(
-                f"{trade['symbol']}.{trade['exchange']}",
+                trade['vt_symbol'],
                 sell_price,
                 trade['volume']
             )
@@ -479,35 +721,49 @@ class GridStrategy(CtaTemplate):
             # Sell order filled, place buy order below
             buy_price = trade['price'] - self.grid_size
             self.buy(
-                f"{trade['symbol']}.{trade['exchange']}",
+                trade['vt_symbol'],
                 buy_price,
                 trade['volume']
             )
     
-    def check_grid_orders(self, tick: dict):
-        """Check and place grid orders"""
-        vt_symbol = f"{tick['symbol']}.{tick['exchange']}"
-        current_price = tick['last_price']
+    def update_grid_levels(self, anchor_price: float):
+        """Recompute grid levels around a new anchor price"""
+        self._anchor_price = anchor_price
+        self._buy_levels = {}
+        self._sell_levels = {}
         
-        # Place buy orders below current price
         for i in range(1, self.grid_num + 1):
-            buy_price = current_price - i * self.grid_size
+            buy_price = anchor_price - i * self.grid_size
+            self._buy_levels[int(round(buy_price / self.pricetick))] = buy_price
             
-            # Check if order already exists
-            if str(buy_price) not in self.buy_orders:
-                orderid = self.buy(vt_symbol, buy_price, self.order_size)
-                if orderid:
-                    self.buy_orders[str(buy_price)] = orderid
+            sell_price = anchor_price + i * self.grid_size
+            self._sell_levels[int(round(sell_price / self.pricetick))] = sell_price
+    
+    def check_grid_orders(self, tick: dict):
+        """Check and place grid orders"""
+        vt_symbol = tick['vt_symbol']
+        current_price = tick['last_price']
         
-        # Place sell orders above current price
-        for i in range(1, self.grid_num + 1):
-            sell_price = current_price + i * self.grid_size
-            
-            # Check if order already exists
-            if str(sell_price) not in self.sell_orders:
-                orderid = self.sell(vt_symbol, sell_price, self.order_size)
-                if orderid:
-                    self.sell_orders[str(sell_price)] = orderid
+        # Only move the grid once price drifts half a grid away from the anchor
+        if (
+            self._anchor_price is None
+            or abs(current_price - self._anchor_price) > self.grid_size / 2
+        ):
+            self.update_grid_levels(current_price)
+        
+        # Place buy orders on levels below the anchor that have none yet
+        for level in self._buy_levels.keys() - self.buy_orders.keys():
+            orderid = self.buy(vt_symbol, self._buy_levels[level], self.order_size)
+            if orderid:
+                self.buy_orders[level] = orderid
+                self._order_ticks[orderid] = level
+        
+        # Place sell orders on levels above the anchor that have none yet
+        for level in self._sell_levels.keys() - self.sell_orders.keys():
+            orderid = self.sell(vt_symbol, self._sell_levels[level], self.order_size)
+            if orderid:
+                self.sell_orders[level] = orderid
+                self._order_ticks[orderid] = level
 
 
 def run_strategy_example():
@@ -533,6 +789,7 @@ def run_strategy_example():
     test_bar = {
         'symbol': 'BTCUSDT',
         'exchange': 'BINANCE',
+        'vt_symbol': 'BTCUSDT.BINANCE',
         'datetime': datetime.now(),
         'interval': '1m',
         'open': 50000.0,
@@ -570,6 +827,7 @@ def run_strategy_example():
     test_tick = {
         'symbol': 'BTCUSDT',
         'exchange': 'BINANCE',
+        'vt_symbol': 'BTCUSDT.BINANCE',
         'datetime': datetime.now(),
         'last_price': 50000.0,
         'volume': 100.0,
@@ -255,6 +255,31 @@ impl BacktestingEngine {
 
     /// Clear all previous backtesting data
     pub fn clear_data(&mut self) {
+        self.clear_run_state();
+        self.history_data.clear();
+        self.depth_data.clear();
+    }
+
+    /// Reset the engine for another run over the same data
+    ///
+    /// Clears orders, trades, position, daily results, logs, risk counters,
+    /// the strategy and its context (registered indicators, bar caches), but
+    /// keeps the loaded history and the `set_parameters` settings, so a
+    /// parameter sweep only has to load its bars once. As with `clear_data`,
+    /// a SimulatedExchange is dropped and must be enabled again if needed.
+    pub fn reset(&mut self) {
+        self.clear_run_state();
+        self.strategy = None;
+
+        let context = match self.strategy_context.database() {
+            Some(database) => StrategyContext::with_database(Arc::clone(database)),
+            None => StrategyContext::new(),
+        };
+        self.strategy_context = Arc::new(context);
+    }
+
+    /// Clear per-run state shared by `clear_data` and `reset`
+    fn clear_run_state(&mut self) {
         self.limit_order_count = 0;
         self.limit_orders.clear();
         self.active_limit_orders.clear();
@@ -270,10 +295,9 @@ impl BacktestingEngine {
         self.frozen_close_volume = 0.0;
         self.daily_results.clear();
         self.daily_result = None;
+        self.risk_engine.reset();
         
         self.logs.clear();
-        self.history_data.clear();
-        self.depth_data.clear();
 
         self.emulated_order_count = 0;
         self.emulated_orders.clear();
@@ -2889,6 +2913,21 @@ impl BacktestingEngine {
         &self.vt_symbol
     }
 
+    /// Get symbol (without exchange suffix)
+    pub fn get_symbol(&self) -> &str {
+        &self.symbol
+    }
+
+    /// Get exchange
+    pub fn get_exchange(&self) -> Exchange {
+        self.exchange
+    }
+
+    /// Get bar interval
+    pub fn get_interval(&self) -> Interval {
+        self.interval
+    }
+
     /// Get contract data for the trading symbol.
     ///
     /// Constructs a ContractData from the engine's settings (pricetick, size, etc.).
@@ -3085,6 +3124,131 @@ mod tests {
         assert!(engine.history_data.is_empty());
     }
 
+    /// Minimal indicator used to check that reset drops registrations
+    struct AlwaysReadyIndicator;
+
+    impl crate::strategy::template::StrategyIndicator for AlwaysReadyIndicator {
+        fn name(&self) -> &str {
+            "always_ready"
+        }
+
+        fn update(&mut self, _bar: &BarData) -> bool {
+            true
+        }
+
+        fn current_value(&self) -> Option<f64> {
+            Some(1.0)
+        }
+    }
+
+    /// Engine with parameters, one bar of history, an open order, a filled
+    /// long trade, a registered indicator and a recorded risk trade
+    fn engine_after_run() -> BacktestingEngine {
+        let mut engine = BacktestingEngine::new();
+        engine.set_parameters(
+            "BTCUSDT.BINANCE".to_string(),
+            Interval::Minute,
+            Utc.with_ymd_and_hms(2024, 1, 1, 0, 0, 0).unwrap(),
+            Utc.with_ymd_and_hms(2024, 1, 31, 23, 59, 59).unwrap(),
+            0.001,
+            0.5,
+            1.0,
+            0.01,
+            100_000.0,
+            BacktestingMode::Bar,
+        );
+        engine.set_history_data(vec![BarData {
+            gateway_name: "TEST".to_string(),
+            symbol: "BTCUSDT".to_string(),
+            exchange: Exchange::Binance,
+            datetime: Utc.with_ymd_and_hms(2024, 1, 15, 10, 0, 0).unwrap(),
+            interval: Some(Interval::Minute),
+            open_price: 50000.0,
+            high_price: 50100.0,
+            low_price: 49900.0,
+            close_price: 50050.0,
+            volume: 100.0,
+            turnover: 5000000.0,
+            open_interest: 0.0,
+            extra: None,
+        }]);
+
+        engine.send_limit_order(OrderRequest::new(
+            "BTCUSDT".to_string(),
+            Exchange::Binance,
+            Direction::Long,
+            OrderType::Limit,
+            1.0,
+        ));
+
+        let mut trade = TradeData::new(
+            "BACKTESTING".to_string(),
+            "BTCUSDT".to_string(),
+            Exchange::Binance,
+            "1".to_string(),
+            "1".to_string(),
+        );
+        trade.direction = Some(Direction::Long);
+        trade.offset = Offset::Open;
+        trade.price = 50000.0;
+        trade.volume = 1.0;
+        engine.position.apply_fill(&trade).expect("fill should apply");
+        engine.trade_count = 1;
+        engine.trades.insert(trade.vt_tradeid(), trade);
+
+        engine
+            .strategy_context
+            .register_indicator("BTCUSDT.BINANCE", Box::new(AlwaysReadyIndicator));
+        engine.risk_engine.record_trade(50000.0);
+
+        engine
+    }
+
+    #[test]
+    fn test_reset_keeps_history() {
+        let mut engine = engine_after_run();
+        assert_eq!(engine.limit_order_count, 1);
+        assert!((engine.get_pos() - 1.0).abs() < 1e-10);
+        assert_eq!(engine.strategy_context.get_indicator_refs("BTCUSDT.BINANCE").len(), 1);
+        assert_eq!(engine.risk_engine.daily_trade_count(), 1);
+
+        engine.reset();
+
+        // History and parameters survive
+        assert_eq!(engine.history_data.len(), 1);
+        assert_eq!(engine.vt_symbol, "BTCUSDT.BINANCE");
+        assert!((engine.capital - 100_000.0).abs() < 1e-10);
+
+        // Run state is cleared
+        assert_eq!(engine.limit_order_count, 0);
+        assert!(engine.limit_orders.is_empty());
+        assert!(engine.active_limit_orders.is_empty());
+        assert_eq!(engine.trade_count, 0);
+        assert!(engine.trades.is_empty());
+        assert!((engine.get_pos() - 0.0).abs() < 1e-10);
+        assert!(engine.strategy.is_none());
+        assert!(engine.strategy_context.get_indicator_refs("BTCUSDT.BINANCE").is_empty());
+        assert_eq!(engine.risk_engine.daily_trade_count(), 0);
+        assert!((engine.risk_engine.daily_turnover() - 0.0).abs() < 1e-10);
+    }
+
+    #[test]
+    fn test_clear_data_clears_history_and_run_state() {
+        let mut engine = engine_after_run();
+
+        engine.clear_data();
+
+        assert!(engine.history_data.is_empty());
+        assert_eq!(engine.limit_order_count, 0);
+        assert!(engine.limit_orders.is_empty());
+        assert_eq!(engine.trade_count, 0);
+        assert!(engine.trades.is_empty());
+        assert!((engine.get_pos() - 0.0).abs() < 1e-10);
+        assert_eq!(engine.risk_engine.daily_trade_count(), 0);
+        // Parameters are left as set
+        assert_eq!(engine.vt_symbol, "BTCUSDT.BINANCE");
+    }
+
     #[test]
     fn test_send_limit_order() {
         let mut engine = BacktestingEngine::new();
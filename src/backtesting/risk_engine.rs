@@ -261,6 +261,27 @@ impl RiskEngine {
         self.daily_turnover = 0.0;
     }
 
+    /// Reset all per-run state (daily counters, equity tracking, circuit
+    /// breaker and notional exposure), keeping the config and margin model
+    pub fn reset(&mut self) {
+        self.reset_daily();
+        self.peak_equity = 0.0;
+        self.current_equity = 0.0;
+        self.is_halted = false;
+        self.position_notional.clear();
+        self.total_notional = 0.0;
+    }
+
+    /// Number of trades recorded since the last daily reset
+    pub fn daily_trade_count(&self) -> u64 {
+        self.daily_trade_count
+    }
+
+    /// Turnover recorded since the last daily reset
+    pub fn daily_turnover(&self) -> f64 {
+        self.daily_turnover
+    }
+
     /// Calculate projected position after order fill
     fn projected_position(&self, order: &OrderData, position: &Position) -> f64 {
         let current = position.signed_qty();
@@ -558,6 +579,27 @@ mod tests {
         assert!(!engine.position_notional.contains_key("ETHUSDT"));
     }
 
+    #[test]
+    fn test_reset_clears_run_state() {
+        let config = RiskEngine::portfolio_config(f64::MAX, f64::MAX, 0.1, 1.0);
+        let mut engine = RiskEngine::new(config);
+        engine.record_trade(50_000.0);
+        engine.update_position_notional("BTCUSDT", 50_000.0);
+        engine.update_equity(100_000.0);
+        engine.update_equity(85_000.0);
+        assert!(engine.is_halted());
+
+        engine.reset();
+
+        assert_eq!(engine.daily_trade_count(), 0);
+        assert!((engine.daily_turnover() - 0.0).abs() < 1e-10);
+        assert!((engine.total_notional - 0.0).abs() < 1e-10);
+        assert!(engine.position_notional.is_empty());
+        assert!(!engine.is_halted());
+        // Config is kept
+        assert!((engine.config().max_drawdown_pct - 0.1).abs() < 1e-10);
+    }
+
     #[test]
     fn test_is_halted_default() {
         let engine = RiskEngine::new_unrestricted();
@@ -3,6 +3,7 @@
 //! Allows Python strategies to be backtested using the Rust engine
 
 use chrono::{DateTime, Utc};
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
@@ -15,7 +16,14 @@ use std::sync::{Arc, Mutex};
 use pyo3::types::PyAnyMethods;
 
 /// Python wrapper for BacktestingEngine
-#[pyclass]
+///
+/// An engine is bound to the thread that created it (`unsendable`); using it
+/// from another thread raises instead of blocking. `run_backtesting` releases
+/// the GIL while holding the engine mutex, so a second thread taking that
+/// mutex with the GIL held could otherwise deadlock against the run's
+/// strategy callbacks. To run backtests in parallel, create one engine per
+/// thread.
+#[pyclass(unsendable)]
 pub struct PyBacktestingEngine {
     engine: Mutex<BacktestingEngine>,
     runtime: tokio::runtime::Runtime,
@@ -47,6 +55,14 @@ impl PyBacktestingEngine {
         self.engine.lock().unwrap_or_else(|e| e.into_inner()).clear_data();
     }
 
+    /// Reset run state but keep the loaded history and parameters
+    ///
+    /// Lets one engine be reused across a parameter sweep: call `reset`,
+    /// add the next strategy, then `run_backtesting` again.
+    fn reset(&self) {
+        self.engine.lock().unwrap_or_else(|e| e.into_inner()).reset();
+    }
+
     /// Set fill model by name.
     ///
     /// Args:
@@ -138,6 +154,10 @@ impl PyBacktestingEngine {
     }
 
     /// Set history data from Python list of bars
+    ///
+    /// Deprecated: boxing every bar as a PyBarData and parsing its RFC3339
+    /// timestamp dominates load time for large histories. Prefer
+    /// `set_history_data_arrays`.
     fn set_history_data(&self, bars: Vec<PyBarData>) -> PyResult<()> {
         let mut engine = self.engine.lock().unwrap_or_else(|e| e.into_inner());
         let rust_bars: Vec<BarData> = bars
@@ -148,6 +168,88 @@ impl PyBacktestingEngine {
         Ok(())
     }
 
+    /// Set history data from columnar buffers (e.g. NumPy arrays)
+    ///
+    /// `datetimes` holds UTC epoch nanoseconds as int64
+    /// (`arr.astype("datetime64[ns]").view("int64")`); the price and volume
+    /// columns are float64. Symbol, exchange and interval are taken from
+    /// `set_parameters`, so it must be called first.
+    #[allow(clippy::too_many_arguments)]
+    fn set_history_data_arrays(
+        &self,
+        py: Python,
+        datetimes: PyBuffer<i64>,
+        open: PyBuffer<f64>,
+        high: PyBuffer<f64>,
+        low: PyBuffer<f64>,
+        close: PyBuffer<f64>,
+        volume: PyBuffer<f64>,
+    ) -> PyResult<()> {
+        // Without parameters every bar would be labelled with an empty symbol
+        // and the default exchange and interval
+        if self
+            .engine
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .get_symbol()
+            .is_empty()
+        {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "call set_parameters before set_history_data_arrays",
+            ));
+        }
+
+        let n = datetimes.item_count();
+        for (name, len) in [
+            ("open", open.item_count()),
+            ("high", high.item_count()),
+            ("low", low.item_count()),
+            ("close", close.item_count()),
+            ("volume", volume.item_count()),
+        ] {
+            if len != n {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "{} has {} items, expected {} to match datetimes",
+                    name, len, n
+                )));
+            }
+        }
+
+        let datetimes = datetimes.to_vec(py)?;
+        let open = open.to_vec(py)?;
+        let high = high.to_vec(py)?;
+        let low = low.to_vec(py)?;
+        let close = close.to_vec(py)?;
+        let volume = volume.to_vec(py)?;
+
+        py.detach(|| {
+            let mut engine = self.engine.lock().unwrap_or_else(|e| e.into_inner());
+            let symbol = engine.get_symbol().to_string();
+            let exchange = engine.get_exchange();
+            let interval = engine.get_interval();
+
+            let rust_bars: Vec<BarData> = (0..n)
+                .map(|i| BarData {
+                    gateway_name: "BACKTESTING".to_string(),
+                    symbol: symbol.clone(),
+                    exchange,
+                    datetime: DateTime::<Utc>::from_timestamp_nanos(datetimes[i]),
+                    interval: Some(interval),
+                    open_price: open[i],
+                    high_price: high[i],
+                    low_price: low[i],
+                    close_price: close[i],
+                    volume: volume[i],
+                    turnover: 0.0,
+                    open_interest: 0.0,
+                    extra: None,
+                })
+                .collect();
+            engine.set_history_data(rust_bars);
+        });
+        Ok(())
+    }
+
     /// Load historical data from CSV or database
     fn load_data(&self, py: Python) -> PyResult<()> {
         py.detach(|| {
@@ -292,15 +394,20 @@ impl PyBacktestingEngine {
     }
 
     /// Run backtesting
-    fn run_backtesting(&self, _py: Python) -> PyResult<()> {
-        let mut engine_guard = self.engine.lock().unwrap_or_else(|e| e.into_inner());
-        self.runtime.block_on(async {
-            engine_guard
-                .run_backtesting()
-                .await
-                .map_err(pyo3::exceptions::PyRuntimeError::new_err)
-        })?;
-        Ok(())
+    ///
+    /// The GIL is released for the duration of the run; Python strategy
+    /// callbacks re-acquire it through `Python::attach`, so several engines
+    /// (one per thread) can be driven concurrently from a thread pool.
+    fn run_backtesting(&self, py: Python) -> PyResult<()> {
+        py.detach(|| {
+            let mut engine_guard = self.engine.lock().unwrap_or_else(|e| e.into_inner());
+            self.runtime.block_on(async {
+                engine_guard
+                    .run_backtesting()
+                    .await
+                    .map_err(pyo3::exceptions::PyRuntimeError::new_err)
+            })
+        })
     }
 
     /// Send order
@@ -12,6 +12,7 @@ No external dependencies beyond trade_engine.
 import datetime
 import random
 import sys
+from collections import deque
 from pathlib import Path
 
 # Add the directory containing cta_strategy.py and spot_strategy.py
@@ -40,8 +41,8 @@ class SimpleMAStrategy(Strategy):
         instance = Strategy.__new__(cls, strategy_name, vt_symbols, strategy_type)
         instance.fast_window = 5
         instance.slow_window = 20
-        instance.fast_prices = []
-        instance.slow_prices = []
+        instance.fast_prices = deque(maxlen=instance.fast_window)
+        instance.slow_prices = deque(maxlen=instance.slow_window)
         instance.in_position = False
         return instance
 
@@ -56,16 +57,10 @@ class SimpleMAStrategy(Strategy):
         """Process bar and make trading decisions."""
         close = bar["close_price"]
 
-        # Update price arrays
+        # Update price windows (bounded deques drop the oldest price)
         self.fast_prices.append(close)
         self.slow_prices.append(close)
 
-        # Keep only necessary history
-        if len(self.fast_prices) > self.fast_window:
-            self.fast_prices.pop(0)
-        if len(self.slow_prices) > self.slow_window:
-            self.slow_prices.pop(0)
-
         # Wait for enough data
         if len(self.slow_prices) < self.slow_window:
             return
@@ -104,13 +99,14 @@ class BollingerStrategy(CtaStrategy):
         instance.boll_dev = 2.0
         instance.fixed_size = 1.0
         # Internal state
-        instance.prices = []
         instance.inited = False
         return instance
 
     def __init__(self, engine, strategy_name, vt_symbol, setting=None):
         # CtaStrategy.__init__ handles setting attributes from setting dict
         CtaStrategy.__init__(self, engine, strategy_name, vt_symbol, setting)
+        # Sized after settings are applied so boll_window overrides take effect
+        self.prices = deque(maxlen=int(self.boll_window))
 
     def on_init(self):
         self.write_log(f"BollingerStrategy initialized: {self.strategy_name}")
@@ -119,10 +115,8 @@ class BollingerStrategy(CtaStrategy):
         """Process bar and make trading decisions."""
         close = bar["close_price"]
 
-        # Update price array
+        # Update price window (bounded deque drops the oldest price)
         self.prices.append(close)
-        if len(self.prices) > self.boll_window:
-            self.prices.pop(0)
 
         # Wait for enough data
         if len(self.prices) < self.boll_window:
@@ -1,24 +1,112 @@
-import sys
+import argparse
+import itertools
 import os
-import datetime
-from typing import Dict, Any
-
-# Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
-# Add vnpy_ctastrategy to path
-sys.path.append(
-    os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../../../vnpy_ctastrategy")
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Resolved as an installed package: `pip install -e .` (or
+# `maturin develop --release`)
+from trade_engine import PyBacktestingEngine
+
+# 15-minute bars, matching the interval passed to set_parameters
+BAR_INTERVAL_NS = 15 * 60 * 1_000_000_000
+MOCK_BARS_START = "2024-01-01T00:00"
+
+# Bump whenever generate_mock_bars changes what it produces, so stale cache
+# files are not reused
+MOCK_BARS_VERSION = 1
+MOCK_BAR_FIELDS = ("datetime", "open", "high", "low", "close", "volume")
+
+
+def generate_mock_bars(
+    n: int = 1000, base_price: float = 40000.0, seed: int = 42
+) -> Dict[str, np.ndarray]:
+    """
+    Generate seeded random-walk OHLCV bars as NumPy columns
+
+    The RNG is seeded, so the same inputs always yield the same bars; they
+    are cached to an .npz file in the temp directory, keyed on the generator
+    version, bar count, base price, seed, start and interval, and loaded from
+    there on later runs. An unreadable cache file is regenerated.
+    """
+    # Bars are evenly spaced, so timestamps are plain int64 epoch nanoseconds
+    start_ns = int(np.datetime64(MOCK_BARS_START, "ns").astype(np.int64))
+
+    cache_path = os.path.join(
+        tempfile.gettempdir(),
+        f"mock_bars_v{MOCK_BARS_VERSION}_{n}_{base_price:g}_{seed}"
+        f"_{start_ns}_{BAR_INTERVAL_NS}.npz",
+    )
+    bars = _load_mock_bars(cache_path)
+    if bars is not None:
+        return bars
+
+    rng = np.random.default_rng(seed)
+    open_offsets = rng.uniform(-50, 50, n)
+    high_offsets = rng.uniform(0, 50, n)
+    low_offsets = rng.uniform(0, 50, n)
+    close_fracs = rng.uniform(0, 1, n)
+
+    # Each open drifts from the previous close, so both are running sums of
+    # the per-bar offsets
+    close_offsets = close_fracs * (high_offsets + low_offsets) - low_offsets
+    opens = base_price + np.cumsum(open_offsets)
+    opens[1:] += np.cumsum(close_offsets[:-1])
+
+    bars = {
+        "datetime": start_ns + np.arange(n, dtype=np.int64) * BAR_INTERVAL_NS,
+        "open": opens,
+        "high": opens + high_offsets,
+        "low": opens - low_offsets,
+        "close": opens + close_offsets,
+        "volume": rng.uniform(10, 100, n),
+    }
+    _save_mock_bars(cache_path, bars)
+    return bars
+
+
+def _load_mock_bars(cache_path: str) -> Optional[Dict[str, np.ndarray]]:
+    """Load cached bars, or None if the file is missing or unreadable"""
+    try:
+        with np.load(cache_path) as cached:
+            return {key: cached[key] for key in MOCK_BAR_FIELDS}
+    except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+        # Missing, corrupt or incomplete file: regenerate and overwrite it
+        return None
+
+
+def _save_mock_bars(cache_path: str, bars: Dict[str, np.ndarray]) -> None:
+    """
+    Write bars to the cache atomically
+
+    The file is written under a temporary name in the same directory and
+    moved into place, so concurrent runs never see a partial file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(cache_path), suffix=".npz.tmp"
     )
-)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **bars)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is only an optimisation, a failed write is not an error
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
-from trade_engine import PyBacktestingEngine, PyBarData
-from vnpy_ctastrategy.strategies.boll_channel_strategy import BollChannelStrategy
 
+def create_engine(
+    bars: Optional[Dict[str, np.ndarray]] = None, verbose: bool = True
+) -> PyBacktestingEngine:
+    """Create an engine with the backtest parameters and mock bars loaded"""
+    log = print if verbose else (lambda *args: None)
 
-def run_backtest():
-    """Run backtest for BollChannelStrategy"""
-    print("Initializing Backtesting Engine...")
+    log("Initializing Backtesting Engine...")
     engine = PyBacktestingEngine()
 
     # Set parameters
@@ -34,46 +122,54 @@ def run_backtest():
         capital=10000.0,
     )
 
-    print("Generating Mock Data...")
-    # Generate some mock data for verification as we don't have DB connected
-    bars = []
-    base_price = 40000.0
-    import random
-
-    start_dt = datetime.datetime(2024, 1, 1)
-    for i in range(1000):
-        dt = start_dt + datetime.timedelta(minutes=15 * i)
-        open_price = base_price + random.uniform(-50, 50)
-        high_price = open_price + random.uniform(0, 50)
-        low_price = open_price - random.uniform(0, 50)
-        close_price = random.uniform(low_price, high_price)
-
-        # Add some trend to make it interesting
-        base_price = close_price
-
-        bar = PyBarData(
-            gateway_name="BACKTESTING",
-            symbol="BTCUSDT",
-            exchange="BINANCE",
-            datetime=dt.isoformat() + "+00:00",
-            interval="1m",
-            open_price=open_price,
-            high_price=high_price,
-            low_price=low_price,
-            close_price=close_price,
-            volume=random.uniform(10, 100),
-        )
-        bars.append(bar)
+    if bars is None:
+        log("Generating Mock Data...")
+        # Generate some mock data for verification as we don't have DB connected
+        bars = generate_mock_bars()
+
+    log(f"Loading {len(bars['close'])} mock bars...")
+    # Symbol, exchange and interval come from set_parameters above
+    engine.set_history_data_arrays(
+        datetimes=bars["datetime"],
+        open=bars["open"],
+        high=bars["high"],
+        low=bars["low"],
+        close=bars["close"],
+        volume=bars["volume"],
+    )
+    return engine
 
-    print(f"Loading {len(bars)} mock bars...")
-    engine.set_history_data(bars)
 
-    print("Adding Strategy...")
+def run_backtest(
+    engine: Optional[PyBacktestingEngine] = None,
+    boll_window: int = 20,
+    boll_dev: float = 2.0,
+    verbose: bool = True,
+):
+    """
+    Run backtest for BollChannelStrategy and return its statistics
+
+    A pre-populated engine is reset and reused, keeping its bars; without
+    one a fresh engine is created.
+    """
+    # Imported here so reusing this module's helpers does not pull in the
+    # strategy's dependency tree; vnpy_ctastrategy is an editable install
+    # alongside trade_engine
+    from vnpy_ctastrategy.strategies.boll_channel_strategy import BollChannelStrategy
+
+    log = print if verbose else (lambda *args: None)
+
+    if engine is None:
+        engine = create_engine(verbose=verbose)
+    else:
+        engine.reset()
+
+    log("Adding Strategy...")
 
     # vnpy CtaTemplate signature: __init__(self, engine, strategy_name, vt_symbol, setting)
     # We need to pass the engine object (self) as first argument
     # Use add_strategy_with_class to let Rust instantiate with correct vnpy signature
-    setting = {"boll_window": 20, "boll_dev": 2.0}
+    setting = {"boll_window": boll_window, "boll_dev": boll_dev}
 
     engine.add_strategy_with_class(
         BollChannelStrategy,  # Strategy class (not instance)
@@ -82,22 +178,104 @@ def run_backtest():
         setting,
     )
 
-    print("Running Backtest...")
+    log("Running Backtest...")
     try:
         engine.run_backtesting()
     except AttributeError as e:
         print(f"Error: run_backtesting method not found: {e}")
-        return
+        return None
 
-    print("Calculating Statistics...")
-    stats = engine.calculate_statistics(True)
+    log("Calculating Statistics...")
+    # Convert to a plain dict in one call rather than reading each field
+    # through the PyO3 wrapper; dicts also pickle back from pool workers
+    stats = engine.calculate_statistics(verbose).to_dict()
 
     # Print results
-    print("\nBacktesting Results:")
-    print(f"Total Return: {stats.total_net_pnl:.2f}")
-    print(f"Sharpe Ratio: {stats.sharpe_ratio:.2f}")
-    print(f"Max Drawdown: {stats.max_drawdown:.2f}")
+    log("\nBacktesting Results:")
+    log(f"Total Return: {stats['total_net_pnl']:.2f}")
+    log(f"Sharpe Ratio: {stats['sharpe_ratio']:.2f}")
+    log(f"Max Drawdown: {stats['max_drawdown']:.2f}")
+    return stats
+
+
+# Per-process engine for the process-pool sweep, created on first use
+_worker_engine: Optional[PyBacktestingEngine] = None
+
+
+def _run_once(params: Tuple[int, float]) -> Optional[Dict[str, Any]]:
+    """
+    Process-pool worker: backtest one (boll_window, boll_dev) point
+
+    Each worker process loads the cached .npz bars into its own engine on
+    its first task and resets that engine for every later one.
+    """
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = create_engine(generate_mock_bars(), verbose=False)
+    return run_backtest(_worker_engine, *params, verbose=False)
+
+
+def run_parameter_sweep(
+    boll_windows: Iterable[int] = (20, 30, 60, 120),
+    boll_devs: Iterable[float] = (0.1, 0.5, 1.0, 1.5, 2.0, 2.5),
+    use_processes: bool = True,
+) -> List[Tuple[int, float, Optional[Dict[str, Any]]]]:
+    """
+    Backtest every (boll_window, boll_dev) pair in parallel
+
+    Points are independent, so the grid is split across workers while each
+    backtest itself stays sequential in time. With use_processes the grid
+    runs on a process pool whose workers load the bars from the .npz cache
+    written here up front. Otherwise it runs on a thread pool:
+    run_backtesting releases the GIL while the Rust engine replays bars, and
+    each thread loads the shared bars into its own engine once.
+    """
+    bars = generate_mock_bars()
+    grid = list(itertools.product(boll_windows, boll_devs))
+
+    if use_processes:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            all_stats = list(executor.map(_run_once, grid))
+    else:
+        local = threading.local()
+
+        def run_point(params: Tuple[int, float]):
+            # Engines are bound to the thread that created them
+            if not hasattr(local, "engine"):
+                local.engine = create_engine(bars, verbose=False)
+            return run_backtest(local.engine, *params, verbose=False)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            all_stats = list(executor.map(run_point, grid))
+
+    results = [(window, dev, stats) for (window, dev), stats in zip(grid, all_stats)]
+
+    print(f"\n{'Window':>8} {'Dev':>6} {'Net PnL':>12} {'Sharpe':>8} {'Max DD':>12}")
+    for window, dev, stats in results:
+        if stats is None:
+            continue
+        print(
+            f"{window:>8} {dev:>6.2f} {stats['total_net_pnl']:>12.2f} "
+            f"{stats['sharpe_ratio']:>8.2f} {stats['max_drawdown']:>12.2f}"
+        )
+    return results
 
 
 if __name__ == "__main__":
-    run_backtest()
+    parser = argparse.ArgumentParser(description="Backtest BollChannelStrategy")
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="run the (boll_window, boll_dev) grid instead of a single backtest",
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="run the sweep on a thread pool instead of a process pool",
+    )
+    args = parser.parse_args()
+
+    if args.sweep:
+        run_parameter_sweep(use_processes=not args.threads)
+    else:
+        run_backtest()
@@ -88,6 +88,11 @@ impl StrategyContext {
         self.database = Some(database);
     }
 
+    /// Get the database backend, if one is set
+    pub fn database(&self) -> Option<&Arc<dyn BaseDatabase>> {
+        self.database.as_ref()
+    }
+
     /// Get latest tick for symbol
     pub fn get_tick(&self, vt_symbol: &str) -> Option<TickData> {
         self.tick_cache
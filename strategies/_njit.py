@@ -0,0 +1,19 @@
+"""
+Optional Numba JIT decorator for strategy kernels
+
+Usage:
+    from _njit import njit
+
+    @njit(cache=True)
+    def kernel(...): ...
+
+When numba is not installed the decorator is a no-op and kernels run as
+plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional, fall back to running kernels as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
@@ -16,10 +16,39 @@ Changes from vnpy version:
 - Spot-only: removed short/cover calls, long-only breakout
 - Market-price execution to avoid fill-price distortion
 - Breakout entry instead of mean-reversion entry
+- Bollinger bands computed by a Numba kernel over the last boll_window closes
 """
 
+import math
+
+import numpy as np
+
 from trade_engine import CtaStrategy
 from cta_utils import BarGenerator, ArrayManager
+from _njit import njit
+
+
+@njit(cache=True)
+def _boll_update(closes, dev):
+    """
+    Bollinger bands of a close window.
+
+    Returns (mid, upper, lower) using the population standard deviation,
+    matching ArrayManager.boll for the same window.
+    """
+    n = closes.shape[0]
+    total = 0.0
+    for i in range(n):
+        total += closes[i]
+    mid = total / n
+
+    sq_sum = 0.0
+    for i in range(n):
+        diff = closes[i] - mid
+        sq_sum += diff * diff
+    std = math.sqrt(sq_sum / n)
+
+    return mid, mid + dev * std, mid - dev * std
 
 
 class BollChannelStrategy(CtaStrategy):
@@ -60,7 +89,9 @@ class BollChannelStrategy(CtaStrategy):
         self.write_log("策略初始化")
 
         self.bg = BarGenerator(self.on_bar)
-        self.am = ArrayManager()
+        # The band kernel reads the last boll_window closes, so the buffer
+        # must hold at least that many
+        self.am = ArrayManager(max(100, int(self.boll_window)))
 
         self.load_bar(10)
 
@@ -93,7 +124,10 @@ class BollChannelStrategy(CtaStrategy):
         if not am.inited:
             return
 
-        self.boll_up, self.boll_down = am.boll(self.boll_window, self.boll_dev)
+        # Only the latest band is needed, so compute it over the last window
+        # instead of rebuilding the full rolling arrays every bar
+        closes = np.array(am.close[-int(self.boll_window):], dtype=np.float64)
+        _, self.boll_up, self.boll_down = _boll_update(closes, self.boll_dev)
         self.atr_value = am.atr(self.atr_window)
 
         close_price = bar["close_price"]
@@ -10,7 +10,7 @@ import sys
 import os
 import importlib.util
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import random
 
 # Add strategies directory to path
@@ -42,54 +42,49 @@ def generate_synthetic_bars(num_bars: int = 500, start_price: float = 50000.0):
     """
     from trade_engine import PyBarData
     
-    bars = []
     price = start_price
-    base_time = datetime(2024, 1, 1, 0, 0, 0)
+    base_time = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
     
     # Calculate bars per day to span the data across ~365 days
     # This ensures we have meaningful daily returns for Sharpe calculation
     num_days = max(1, num_bars // 10)  # ~10 bars per day, spanning many days
     bars_per_day = max(1, num_bars // num_days)
     
-    bar_count = 0
-    for day in range(num_days):
-        for bar_in_day in range(bars_per_day):
-            if bar_count >= num_bars:
-                break
-            
-            # Random walk with slight drift
-            change_pct = random.gauss(0.0001, 0.02)  # 0.01% drift, 2% volatility
-            open_price = price
-            close_price = price * (1 + change_pct)
-            high_price = max(open_price, close_price) * (1 + abs(random.gauss(0, 0.005)))
-            low_price = min(open_price, close_price) * (1 - abs(random.gauss(0, 0.005)))
-            volume = random.uniform(100, 1000)
-            
-            # Spread bars throughout the day (24 hours for crypto)
-            # Each day gets bars_per_day bars spread across 24 hours
-            minutes_offset = int((bar_in_day / bars_per_day) * 24 * 60)
-            dt = base_time + timedelta(days=day, minutes=minutes_offset)
-            # PyBarData expects datetime as RFC3339 string
-            dt_str = dt.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            
-            bar = PyBarData(
-                gateway_name="BACKTESTING",
-                symbol="BTCUSDT",
-                exchange="BINANCE",
-                datetime=dt_str,
-                interval="1m",
-                open_price=open_price,
-                high_price=high_price,
-                low_price=low_price,
-                close_price=close_price,
-                volume=volume,
-            )
-            bars.append(bar)
-            price = close_price
-            bar_count += 1
+    # The bar count is known up front, so fill a pre-sized list in place
+    total_bars = min(num_bars, num_days * bars_per_day)
+    bars = [None] * total_bars
+    
+    for i in range(total_bars):
+        day, bar_in_day = divmod(i, bars_per_day)
         
-        if bar_count >= num_bars:
-            break
+        # Random walk with slight drift
+        change_pct = random.gauss(0.0001, 0.02)  # 0.01% drift, 2% volatility
+        open_price = price
+        close_price = price * (1 + change_pct)
+        high_price = max(open_price, close_price) * (1 + abs(random.gauss(0, 0.005)))
+        low_price = min(open_price, close_price) * (1 - abs(random.gauss(0, 0.005)))
+        volume = random.uniform(100, 1000)
+        
+        # Spread bars throughout the day (24 hours for crypto)
+        # Each day gets bars_per_day bars spread across 24 hours
+        minutes_offset = int((bar_in_day / bars_per_day) * 24 * 60)
+        dt = base_time + timedelta(days=day, minutes=minutes_offset)
+        
+        bars[i] = PyBarData(
+            gateway_name="BACKTESTING",
+            symbol="BTCUSDT",
+            exchange="BINANCE",
+            # PyBarData expects an RFC3339 string; a UTC-aware datetime
+            # formats its own +00:00 offset
+            datetime=dt.isoformat(),
+            interval="1m",
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            volume=volume,
+        )
+        price = close_price
     
     return bars
 
@@ -657,14 +657,20 @@ class PyBacktestingStatistics:
     total_commission: float
     daily_commission: float
 
+    def to_dict(self) -> Dict[str, Any]: ...
+
 
 class PyBacktestingEngine:
-    """Python wrapper for the Rust backtesting engine."""
+    """Python wrapper for the Rust backtesting engine.
+
+    Bound to the thread that created it; use one engine per thread.
+    """
 
     def __init__(self) -> None: ...
 
     def set_risk_manager(self, risk_manager: PyRiskManager) -> None: ...
     def clear_data(self) -> None: ...
+    def reset(self) -> None: ...
     def set_fill_model(self, model_name: str) -> None: ...
 
     def set_parameters(
@@ -681,12 +687,22 @@ class PyBacktestingEngine:
         mode: Optional[str] = ...,
     ) -> None: ...
 
+    # Deprecated: prefer set_history_data_arrays for large histories.
     def set_history_data(self, bars: List[PyBarData]) -> None: ...
+    def set_history_data_arrays(
+        self,
+        datetimes: Any,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any,
+    ) -> None: ...
     def add_strategy(self, strategy: Strategy, setting: Optional[Dict[str, str]] = ...) -> None: ...
     def load_data(self) -> None: ...
     def run_backtesting(self) -> None: ...
     def calculate_result(self) -> List[Dict[str, Any]]: ...
-    def calculate_statistics(self) -> PyBacktestingStatistics: ...
+    def calculate_statistics(self, output: Optional[bool] = ...) -> PyBacktestingStatistics: ...
     def show_chart(self) -> None: ...
     def get_all_results(self) -> List[Dict[str, Any]]: ...
     def get_daily_results(self) -> List[Dict[str, Any]]: ...